@@ -1,7 +1,7 @@
 import functools
 import platform
-import threading
 import urllib.parse
+from contextvars import ContextVar
 
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
@@ -16,6 +16,11 @@ engine = create_engine(
         f"@{settings.DATABASE_HOST}:{settings.DATABASE_PORT}/{settings.DATABASE_NAME}"
     ),
     echo=False,
+    pool_size=settings.DATABASE_POOL_SIZE,
+    max_overflow=settings.DATABASE_MAX_OVERFLOW,
+    pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+    pool_recycle=settings.DATABASE_POOL_RECYCLE,
+    pool_pre_ping=True,
     connect_args={
         "application_name": platform.node(),
         "options": f"-csearch_path={settings.DATABASE_SCHEMA}",
@@ -28,13 +33,12 @@ Session = sessionmaker(
     engine,
     expire_on_commit=False,
 )
-_current_session_wrapper = threading.local()
-_current_session_wrapper.value = None
+_current_session_ctx: ContextVar[SQLAlchemySession | None] = ContextVar("current_session", default=None)
 
 
 def with_database_session(func):
     """
-    Set up a thread-global SQLAlchemy session to be accessed
+    Set up a context-global SQLAlchemy session to be accessed
     calling `get_current_session()` from any place.
 
     NOTE: Call once on the main entry point.
@@ -42,18 +46,17 @@ def with_database_session(func):
 
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        try:
-            session = get_current_session()
-            if session:
-                return func(*args, **kwargs)
+        if get_current_session():
+            return func(*args, **kwargs)
 
-            with Session() as session:
-                _current_session_wrapper.value = session
+        with Session() as session:
+            token = _current_session_ctx.set(session)
+            try:
                 return func(*args, **kwargs)
-        finally:
-            _current_session_wrapper.value = None
+            finally:
+                _current_session_ctx.reset(token)
     return wrapper
 
 
 def get_current_session() -> SQLAlchemySession:
-    return getattr(_current_session_wrapper, "value", None)
+    return _current_session_ctx.get()
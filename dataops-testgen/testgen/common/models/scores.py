@@ -6,15 +6,30 @@ if TYPE_CHECKING:
     from testgen.common.models.table_group import TableGroup
 
 import enum
+from collections import defaultdict
 from collections.abc import Iterable
 from datetime import UTC, datetime
 from itertools import groupby
 from typing import Literal, Self, TypedDict
 from uuid import UUID, uuid4
 
-from sqlalchemy import Boolean, Column, DateTime, Enum, Float, ForeignKey, Integer, String, delete, func, select, text
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Enum,
+    Float,
+    ForeignKey,
+    Integer,
+    String,
+    and_,
+    delete,
+    func,
+    select,
+    text,
+)
 from sqlalchemy.dialects import postgresql
-from sqlalchemy.orm import aliased, attributes, relationship
+from sqlalchemy.orm import aliased, attributes, joinedload, relationship, selectinload
 
 from testgen.common import read_template_sql_file
 from testgen.common.models import Base, get_current_session
@@ -120,14 +135,18 @@ class ScoreDefinition(Base):
         return definition
 
     @classmethod
-    def get(cls, id_: str) -> Self | None:
+    def get(cls, id_: str, last_history_items: int = 0) -> Self | None:
         if not is_uuid4(id_):
             return None
 
         definition = None
         db_session = get_current_session()
         query = select(ScoreDefinition).where(ScoreDefinition.id == id_)
-        definition = db_session.scalars(query).first()
+        definition = db_session.scalars(query).unique().first()
+
+        if definition and last_history_items > 0:
+            cls._load_latest_history([definition], last_history_items)
+
         return definition
 
     @classmethod
@@ -138,14 +157,16 @@ class ScoreDefinition(Base):
         sorted_by: str | None = "name",
         last_history_items: int = 0,
     ) -> Iterable[Self]:
-        from sqlalchemy.orm import joinedload
-        
         definitions = []
         db_session = get_current_session()
         # Eagerly load criteria and all nested relationships to avoid DetachedInstanceError
         # Chain: ScoreDefinition -> criteria -> filters -> next_filter
+        # Results are a separate collection, load them in one batched query instead of
+        # joining them too and multiplying the rows by the number of filters.
+        # bulk_load_score_cards builds the scorecards from these, without querying them again
         query = select(ScoreDefinition).options(
-            joinedload(ScoreDefinition.criteria).joinedload(ScoreDefinitionCriteria.filters).joinedload(ScoreDefinitionFilter.next_filter)
+            joinedload(ScoreDefinition.criteria).joinedload(ScoreDefinitionCriteria.filters).joinedload(ScoreDefinitionFilter.next_filter),
+            selectinload(ScoreDefinition.results),
         )
         if name_filter:
             query = query.where(ScoreDefinition.name.ilike(f"%{name_filter}%"))
@@ -154,40 +175,88 @@ class ScoreDefinition(Base):
 
         query = query.order_by(text(sorted_by))
         definitions = db_session.scalars(query).unique().all()
-        definitions_map = {}
 
         if last_history_items > 0:
             for definition in definitions:
-                definitions_map[str(definition.id)] = definition
                 db_session.expunge(definition)
-                attributes.set_committed_value(definition, "history", [])
-
-            HistoryEntry = aliased(ScoreDefinitionResultHistoryEntry)
-            history_subquery = select(
-                HistoryEntry.definition_id,
-                HistoryEntry.category,
-                HistoryEntry.score,
-                HistoryEntry.last_run_time,
-                func.row_number().over(
-                    partition_by=HistoryEntry.definition_id,
-                    order_by=HistoryEntry.last_run_time.desc(),
-                )
-                .label("rn"),
-            ).subquery()
-            history_query = select(history_subquery).where(history_subquery.c.rn <= last_history_items)
-
-            history_entries = db_session.execute(history_query).unique().all()
-            for entry in history_entries:
-                if (definition := definitions_map.get(str(entry.definition_id))):
-                    definition.history.append(ScoreDefinitionResultHistoryEntry(
-                        definition_id=entry.definition_id,
-                        category=entry.category,
-                        score=entry.score,
-                        last_run_time=entry.last_run_time,
-                    ))
+            cls._load_latest_history(definitions, last_history_items)
 
         return definitions
 
+    @classmethod
+    def list_summary(
+        cls,
+        project_code: str | None = None,
+        name_filter: str | None = None,
+        sorted_by: str | None = "name",
+    ) -> list:
+        """
+        Lightweight alternative to `all()` that only reads the id, project
+        code, name and category of the definitions, without criteria,
+        results or history.
+        """
+        query = select(
+            ScoreDefinition.id,
+            ScoreDefinition.project_code,
+            ScoreDefinition.name,
+            ScoreDefinition.category,
+        )
+        if name_filter:
+            query = query.where(ScoreDefinition.name.ilike(f"%{name_filter}%"))
+        if project_code:
+            query = query.where(ScoreDefinition.project_code == project_code)
+
+        query = query.order_by(text(sorted_by))
+        return get_current_session().execute(query).all()
+
+    @classmethod
+    def _fetch_latest_history(cls, definition_ids: list[UUID], last_history_items: int) -> list:
+        """
+        Fetches up to `last_history_items` of the latest history entries
+        of each definition with a single query, oldest entries first.
+        """
+        HistoryEntry = aliased(ScoreDefinitionResultHistoryEntry)
+        ranked_subquery = select(
+            HistoryEntry.definition_id,
+            HistoryEntry.category,
+            HistoryEntry.last_run_time,
+            func.row_number().over(
+                partition_by=HistoryEntry.definition_id,
+                order_by=HistoryEntry.last_run_time.desc(),
+            )
+            .label("rn"),
+        ).where(HistoryEntry.definition_id.in_(definition_ids)).subquery()
+        history_query = (
+            select(ScoreDefinitionResultHistoryEntry)
+            .join(
+                ranked_subquery,
+                and_(
+                    ScoreDefinitionResultHistoryEntry.definition_id == ranked_subquery.c.definition_id,
+                    ScoreDefinitionResultHistoryEntry.category == ranked_subquery.c.category,
+                    ScoreDefinitionResultHistoryEntry.last_run_time == ranked_subquery.c.last_run_time,
+                ),
+            )
+            .where(ranked_subquery.c.rn <= last_history_items)
+            .order_by(ScoreDefinitionResultHistoryEntry.last_run_time.asc())
+        )
+        return get_current_session().scalars(history_query).all()
+
+    @classmethod
+    def _load_latest_history(cls, definitions: list[ScoreDefinition], last_history_items: int) -> None:
+        """
+        Replaces the `history` of the definitions with their latest
+        `last_history_items` entries, without marking them as modified.
+
+        The entries are loaded as persistent instances of the session, so
+        saving a definition afterwards doesn't try to insert them again.
+        """
+        history = defaultdict(list)
+        for entry in cls._fetch_latest_history([definition.id for definition in definitions], last_history_items):
+            history[str(entry.definition_id)].append(entry)
+
+        for definition in definitions:
+            attributes.set_committed_value(definition, "history", history[str(definition.id)])
+
     def save(self) -> None:
         db_session = get_current_session()
         db_session.add(self)
@@ -335,8 +404,50 @@ class ScoreDefinition(Base):
             "definition": self,
         }
 
+    @classmethod
+    def bulk_load_score_cards(
+        cls,
+        definitions: Iterable[ScoreDefinition],
+        last_history_items: int = 0,
+    ) -> dict[str, ScoreCard]:
+        """
+        Reads the cached values to build the scorecards of several
+        definitions at once.
+
+        Results are read from the definitions, `all()` already loads them
+        for every definition. When `last_history_items` is set, the history
+        is fetched with a single query capped per definition. Returned
+        scorecards are keyed by the definition id as string.
+        """
+        definitions_map = {str(definition.id): definition for definition in definitions}
+        if not definitions_map:
+            return {}
+
+        history = defaultdict(list)
+        if last_history_items > 0:
+            definition_ids = [definition.id for definition in definitions_map.values()]
+            for entry in cls._fetch_latest_history(definition_ids, last_history_items):
+                history[str(entry.definition_id)].append(entry)
+
+        return {
+            definition_id: definition._build_cached_score_card(
+                definition.results,
+                history[definition_id],
+                include_definition=True,
+            )
+            for definition_id, definition in definitions_map.items()
+        }
+
     def as_cached_score_card(self, include_definition: bool = False) -> ScoreCard:
         """Reads the cached values to build a scorecard"""
+        return self._build_cached_score_card(self.results, self.history, include_definition=include_definition)
+
+    def _build_cached_score_card(
+        self,
+        results: Iterable[ScoreDefinitionResult],
+        history: Iterable[ScoreDefinitionResultHistoryEntry],
+        include_definition: bool = False,
+    ) -> ScoreCard:
         root_keys: list[str] = ["score", "profiling_score", "testing_score", "cde_score"]
         score_card: ScoreCard = {
             "id": self.id,
@@ -347,7 +458,7 @@ class ScoreDefinition(Base):
             "definition": self if include_definition else None,
         }
 
-        for result in sorted(self.results, key=lambda r: r.category):
+        for result in sorted(results, key=lambda r: r.category):
             if result.category in root_keys:
                 score_card[result.category] = result.score
                 continue
@@ -359,7 +470,7 @@ class ScoreDefinition(Base):
         if self.cde_score:
             history_categories.append("cde_score")
 
-        for entry in self.history[-50:]:
+        for entry in list(history)[-50:]:
             if entry.category in history_categories:
                 score_card["history"].append({
                     "score": entry.score,
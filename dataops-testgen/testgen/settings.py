@@ -156,6 +156,42 @@ from env variable: `TG_METADATA_DB_SCHEMA`
 defaults to: `testgen`
 """
 
+DATABASE_POOL_SIZE: int = int(os.getenv("TG_METADATA_DB_POOL_SIZE", "10"))
+"""
+Number of connections kept open in the pool to the testgen application
+postgres database.
+
+from env variable: `TG_METADATA_DB_POOL_SIZE`
+defaults to: `10`
+"""
+
+DATABASE_MAX_OVERFLOW: int = int(os.getenv("TG_METADATA_DB_MAX_OVERFLOW", "20"))
+"""
+Number of connections that can be opened beyond the pool size when all
+pooled connections are in use.
+
+from env variable: `TG_METADATA_DB_MAX_OVERFLOW`
+defaults to: `20`
+"""
+
+DATABASE_POOL_TIMEOUT: int = int(os.getenv("TG_METADATA_DB_POOL_TIMEOUT", "30"))
+"""
+Seconds to wait for a connection to become available in the pool before
+giving up.
+
+from env variable: `TG_METADATA_DB_POOL_TIMEOUT`
+defaults to: `30`
+"""
+
+DATABASE_POOL_RECYCLE: int = int(os.getenv("TG_METADATA_DB_POOL_RECYCLE", "1800"))
+"""
+Seconds after which a pooled connection is replaced by a new one, to avoid
+reusing connections dropped by the server or the network.
+
+from env variable: `TG_METADATA_DB_POOL_RECYCLE`
+defaults to: `1800`
+"""
+
 PROJECT_KEY: str = os.getenv("PROJECT_KEY", "DEFAULT")
 """
 Code used to uniquely identify the auto generated project.
@@ -692,6 +692,9 @@ CREATE UNIQUE INDEX idx_tg_last_profile
   ON table_groups (last_complete_profile_run_id)
   WHERE last_complete_profile_run_id IS NOT NULL;
 
+CREATE INDEX ix_tg_project_lower_name
+  ON table_groups(project_code, LOWER(table_groups_name));
+
 -- Index Profile Results - ORIGINAL -- still relevant?
 CREATE INDEX profile_results_tgid_sn_tn_cn
     ON profile_results (table_groups_id, schema_name, table_name, column_name);
@@ -801,6 +804,10 @@ CREATE INDEX idx_dtc_tgid_table
 CREATE INDEX idx_dcc_tg_table_column
   ON data_column_chars (table_groups_id, table_name, column_name);
 
+CREATE INDEX ix_dcc_tgid_ordinal
+  ON data_column_chars(table_groups_id, ordinal_position)
+  INCLUDE (column_id, column_name, table_id, table_name);
+
 -- Conditional Index for dq_scoring views
 CREATE INDEX idx_test_results_filter_join
   ON test_results (test_run_id, table_groups_id, table_name, column_names)
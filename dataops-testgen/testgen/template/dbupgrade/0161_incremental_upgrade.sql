@@ -0,0 +1,9 @@
+SET SEARCH_PATH TO {SCHEMA_NAME};
+
+-- Indexes for the column hierarchy lookup of dashboard filter options
+CREATE INDEX IF NOT EXISTS ix_tg_project_lower_name
+  ON table_groups(project_code, LOWER(table_groups_name));
+
+CREATE INDEX IF NOT EXISTS ix_dcc_tgid_ordinal
+  ON data_column_chars(table_groups_id, ordinal_position)
+  INCLUDE (column_id, column_name, table_id, table_name);
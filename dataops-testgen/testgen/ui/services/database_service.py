@@ -9,6 +9,7 @@ from testgen.utils import to_dataframe
 if TYPE_CHECKING:
     from testgen.common.models.connection import Connection
 
+from collections.abc import Iterator
 from typing import Any
 
 from sqlalchemy import create_engine, text
@@ -36,6 +37,16 @@ def fetch_all_from_db(query: str, params: dict | None = None) -> list[RowMapping
     return cursor.mappings().all()
 
 
+def stream_from_db(query: str, params: dict | None = None, batch_size: int = 1000) -> Iterator[RowMapping]:
+    """
+    Like `fetch_all_from_db`, but reads the rows through a server-side cursor
+    in batches of `batch_size` instead of loading them all into memory.
+    """
+    db_session = get_current_session()
+    cursor: CursorResult = db_session.execute(text(query), params, execution_options={"stream_results": True})
+    yield from cursor.yield_per(batch_size).mappings()
+
+
 # Only use this for old parts of the app that still use dataframes
 # Prefer to use fetch_all_from_db instead and avoid usage of pandas
 def fetch_df_from_db(query: str, params: dict | None = None) -> pd.DataFrame:
@@ -1,8 +1,16 @@
+import sys
+from pathlib import Path
+
 from dotenv import load_dotenv
 
 # Load environment variables from .env file BEFORE any other imports
 load_dotenv()
 
+# Add the dataops-testgen directory to Python path, once for the whole app
+testgen_path = Path(__file__).parent / "dataops-testgen"
+if str(testgen_path) not in sys.path:
+    sys.path.insert(0, str(testgen_path))
+
 from fastapi import FastAPI
 from src.api import router
 from src.routers import data_quality
@@ -15,3 +23,6 @@ app.include_router(data_quality.router, prefix="/api")
 @app.get("/health")
 async def health_check():
     return {"status": "ok"}
+
+# Build the OpenAPI schema at startup, FastAPI caches it for /openapi.json and /docs
+app.openapi()
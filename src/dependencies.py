@@ -1,38 +1,37 @@
 """Dependency injection utilities for FastAPI endpoints"""
-import sys
-from pathlib import Path
-from typing import Generator
-from uuid import UUID
+import re
+from typing import AsyncGenerator
 
 from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
-# Add the dataops-testgen directory to Python path
-testgen_path = Path(__file__).parent.parent / "dataops-testgen"
-if str(testgen_path) not in sys.path:
-    sys.path.insert(0, str(testgen_path))
-
-from testgen.common.models import Session as DBSession, get_current_session
+from testgen.common.models import Session as DBSession, _current_session_ctx
 from testgen.common.models.scores import ScoreDefinition
 from testgen.common.models.project import Project
 
+_UUID_RE = re.compile(r"\A[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\Z")
+
 
-def get_db_session() -> Generator[Session, None, None]:
+async def get_db_session() -> AsyncGenerator[Session, None]:
     """
     Provides database session for FastAPI endpoints.
-    Creates a new session and sets it as the thread-local current session
-    so that testgen models can access it via get_current_session().
+    Creates a new session and sets it as the current session of the request
+    context so that testgen models can access it via get_current_session().
+
+    Declared async so it runs in the request task itself: the context it sets
+    is then copied into the threadpool worker running a sync endpoint, which
+    a sync dependency (run in a worker of its own) can't guarantee.
     """
-    from testgen.common.models import _current_session_wrapper
-    
     session = DBSession()
-    # Set the thread-local session so testgen models can use it
-    _current_session_wrapper.value = session
+    # Set the context session so testgen models can use it
+    token = _current_session_ctx.set(session)
     try:
         yield session
     finally:
-        _current_session_wrapper.value = None
-        session.close()
+        _current_session_ctx.reset(token)
+        # Closing rolls back any open transaction, keep that round-trip off the event loop
+        await run_in_threadpool(session.close)
 
 
 def validate_project_code(project_code: str, db: Session) -> None:
@@ -46,21 +45,24 @@ def validate_project_code(project_code: str, db: Session) -> None:
     Raises:
         HTTPException: If project doesn't exist
     """
-    project = db.query(Project).filter(Project.project_code == project_code).first()
-    if not project:
+    project_exists = db.query(
+        db.query(Project.project_code).filter(Project.project_code == project_code).exists()
+    ).scalar()
+    if not project_exists:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Project '{project_code}' not found"
         )
 
 
-def validate_dashboard_id(dashboard_id: str, db: Session) -> ScoreDefinition:
+def validate_dashboard_id(dashboard_id: str, db: Session, last_history_items: int = 0) -> ScoreDefinition:
     """
     Validates that a dashboard exists and returns it.
     
     Args:
         dashboard_id: Dashboard UUID to validate
         db: Database session
+        last_history_items: Number of latest history entries to load with the dashboard
         
     Returns:
         ScoreDefinition: The dashboard definition
@@ -68,15 +70,13 @@ def validate_dashboard_id(dashboard_id: str, db: Session) -> ScoreDefinition:
     Raises:
         HTTPException: If dashboard doesn't exist or invalid UUID
     """
-    try:
-        uuid_obj = UUID(dashboard_id)
-    except ValueError:
+    if not _UUID_RE.match(dashboard_id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid dashboard ID format: {dashboard_id}"
         )
     
-    dashboard = ScoreDefinition.get(dashboard_id)
+    dashboard = ScoreDefinition.get(dashboard_id, last_history_items=last_history_items)
     if not dashboard:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1,26 +1,25 @@
 """Data Quality Dashboard API Router"""
-import sys
-from collections import defaultdict
+import functools
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from pathlib import Path
-from typing import Dict, List, Literal, Optional
+from typing import List, Literal, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Response, status
+from pydantic import parse_obj_as
 from sqlalchemy.orm import Session
 
-# Add the dataops-testgen directory to Python path
-testgen_path = Path(__file__).parent.parent.parent / "dataops-testgen"
-if str(testgen_path) not in sys.path:
-    sys.path.insert(0, str(testgen_path))
-
 from testgen.commands.run_refresh_score_cards_results import run_refresh_score_cards_results
+from testgen.common.models import with_database_session
 from testgen.common.models.scores import (
     ScoreDefinition,
     ScoreDefinitionCriteria,
     ScoreCategory,
 )
-from testgen.ui.services.database_service import fetch_all_from_db
-from testgen.utils import format_score_card, format_score_card_breakdown, format_score_card_issues
+from testgen.ui.services.database_service import fetch_all_from_db, stream_from_db
+from testgen.utils import format_score_card, format_score_card_breakdown, format_score_card_issues, make_json_safe
 
 from src.dependencies import get_db_session, validate_project_code, validate_dashboard_id
 from src.schemas.data_quality import (
@@ -31,8 +30,31 @@ from src.schemas.data_quality import (
     BreakdownItem,
     IssueItem,
     RecalculateResponse,
+    make_category_score,
 )
-from src.schemas.filter_options import FilterOptions, ColumnHierarchy
+from src.schemas.filter_options import CategoryOption, ColumnHierarchy, FilterFieldMeta, FilterGroup, FilterOptions
+
+_CATEGORY_BY_NAME: dict[str, ScoreCategory] = {m.name: m for m in ScoreCategory}
+
+# Dashboard fields the list can be sorted by, passed as raw SQL to ORDER BY
+_SORTABLE_FIELDS = tuple(ScoreDefinition.__table__.columns.keys())
+
+
+def _get_score_category(name: str) -> ScoreCategory:
+    """
+    Returns the ScoreCategory member with the given name.
+
+    Raises:
+        HTTPException: If the category doesn't exist
+    """
+    try:
+        return _CATEGORY_BY_NAME[name]
+    except KeyError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid category: '{name}'"
+        ) from None
+
 
 # Valid group_by categories for breakdown and issues endpoints
 class GroupByCategory(str, Enum):
@@ -51,6 +73,112 @@ class GroupByCategory(str, Enum):
     transform_level = "transform_level"
     data_product = "data_product"
 
+
+# Valid categories from TestGen
+_VALID_CATEGORIES: frozenset[str] = frozenset(c.value for c in GroupByCategory)
+
+# Map common variations to correct column names (for backwards compatibility)
+_GROUP_BY_ALIASES = {
+    "table_group": "table_groups_name",
+    "table group": "table_groups_name",
+    "tablegroup": "table_groups_name",
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _normalize_group_by(group_by: str) -> str:
+    """
+    Normalizes and validates a group_by value for the breakdown and issues endpoints.
+
+    Raises:
+        HTTPException: If the value is not a valid category
+    """
+    # Values validated by the GroupByCategory enum are used as they are
+    if isinstance(group_by, GroupByCategory):
+        return group_by.value
+
+    normalized_group_by = _GROUP_BY_ALIASES.get(group_by.lower().strip(), group_by)
+    if normalized_group_by not in _VALID_CATEGORIES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid group_by parameter: '{group_by}'. Must be one of: {', '.join(c.value for c in GroupByCategory)}"
+        )
+    return normalized_group_by
+
+
+_DASHBOARD_SCORE_FIELDS = ("score", "cde_score", "profiling_score", "testing_score")
+
+
+def _score_percent(score: Optional[float]) -> Optional[float]:
+    """Convert a 0-1 score into a percentage rounded to one decimal, like the history scores."""
+    if not score or math.isnan(score):
+        return None
+    return round(100 * float(score), 1)
+
+
+def _format_score_card(score_card: dict) -> dict:
+    """Format a score card for a DashboardResponse."""
+    formatted = format_score_card(score_card)
+    # Dashboard scores are sent as numbers, format_score_card only decides
+    # which of them the dashboard definition includes
+    for field in _DASHBOARD_SCORE_FIELDS:
+        if formatted[field] is not None:
+            formatted[field] = _score_percent(score_card.get(field))
+    formatted["categories"] = [
+        make_category_score(category["label"], category["score"])
+        for category in formatted["categories"]
+    ]
+    # History times are sent as epoch seconds, like issue times, take them
+    # from the score card datetimes rather than the formatted ISO strings
+    formatted["history"] = [
+        {**entry, "score": score, "time": make_json_safe(entry["time"])}
+        for entry in score_card.get("history", [])
+        if (score := _score_percent(entry["score"])) is not None
+    ]
+    return formatted
+
+
+_BREAKDOWN_SCORE_FIELDS = frozenset(("impact", "score", "issue_ct"))
+
+# Validate whole item lists in one call instead of constructing models in a loop
+_parse_breakdown_items = functools.partial(parse_obj_as, List[BreakdownItem])
+_parse_issue_items = functools.partial(parse_obj_as, List[IssueItem])
+
+
+def _get_breakdown_items(
+    dashboard: ScoreDefinition,
+    score_type: Literal["score", "cde_score"],
+    group_by: str,
+) -> List[BreakdownItem]:
+    """Get the formatted score breakdown of a dashboard."""
+    breakdown_data = dashboard.get_score_card_breakdown(score_type, group_by)
+    formatted = format_score_card_breakdown(breakdown_data, group_by)
+    
+    # The formatter sets table_groups_id on every item, keep it only when it's populated
+    return _parse_breakdown_items([
+        {
+            "impact": item["impact"],
+            "score": item["score"],
+            "issue_ct": item["issue_ct"],
+            "details": {
+                key: value
+                for key, value in item.items()
+                if key not in _BREAKDOWN_SCORE_FIELDS and (value is not None or key == group_by)
+            },
+        }
+        for item in formatted["items"]
+    ])
+
+
+def _dashboards_json_response(dashboards: DashboardResponse | List[DashboardResponse]) -> Response:
+    """Serialize dashboards with pydantic directly, skipping FastAPI's jsonable_encoder pass."""
+    if isinstance(dashboards, DashboardResponse):
+        content = dashboards.json()
+    else:
+        content = f"[{','.join(dashboard.json() for dashboard in dashboards)}]"
+    return Response(content=content, media_type="application/json")
+
+
 router = APIRouter(prefix="/data-quality", tags=["data-quality"])
 
 
@@ -80,17 +208,10 @@ def create_dashboard(
     score_def.cde_score = dashboard.cde_score
     
     if dashboard.category:
-        score_def.category = ScoreCategory[dashboard.category]
+        score_def.category = _get_score_category(dashboard.category)
     
     # Create criteria with filters
-    filters_data = [
-        {
-            "field": f.field,
-            "value": f.value,
-            "others": f.others
-        }
-        for f in dashboard.filters
-    ]
+    filters_data = [f.dict() for f in dashboard.filters]
     score_def.criteria = ScoreDefinitionCriteria.from_filters(
         filters_data,
         group_by_field=dashboard.group_by_field
@@ -101,7 +222,7 @@ def create_dashboard(
     
     # Get fresh score card and cache it to database
     score_card = score_def.as_score_card(save_to_cache=True)
-    formatted = format_score_card(score_card)
+    formatted = _format_score_card(score_card)
     
     return DashboardResponse(**formatted)
 
@@ -140,39 +261,47 @@ def list_dashboards(
         # Get list with scores and history (for rendering graphs)
         GET /api/data-quality/dashboards?project_code=DEFAULT&include_scores=true&include_history=true
     """
+    if sorted_by not in _SORTABLE_FIELDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid sorted_by parameter: '{sorted_by}'. Must be one of: {', '.join(_SORTABLE_FIELDS)}"
+        )
+
     if project_code:
         validate_project_code(project_code, db)
     
-    # Determine how many history items to fetch
-    history_items = 50 if include_history else 0
-    
-    definitions = ScoreDefinition.all(
-        project_code=project_code,
-        name_filter=name_filter,
-        sorted_by=sorted_by,
-        last_history_items=history_items
-    )
-    
     # If scores or history are requested, return full dashboard details
     if include_scores or include_history:
+        definitions = ScoreDefinition.all(
+            project_code=project_code,
+            name_filter=name_filter,
+            sorted_by=sorted_by,
+        )
+
+        # Load cached results and history for every dashboard in bulk
+        # instead of querying them one dashboard at a time
+        score_cards = ScoreDefinition.bulk_load_score_cards(
+            definitions,
+            last_history_items=50 if include_history else 0,
+        )
+
         result = []
         for d in definitions:
-            # Use fresh score calculation to ensure categories are populated
-            # as_cached_score_card() only works after recalculate has been called
-            score_card = d.as_score_card()
-            
-            # If history is requested and available, merge it from cached data
-            if include_history and d.history:
-                cached_card = d.as_cached_score_card(include_definition=False)
-                score_card["history"] = cached_card.get("history", [])
-            
-            formatted = format_score_card(score_card)
+            score_card = score_cards[str(d.id)]
+
+            # Dashboards that were never calculated have no cached results,
+            # fall back to a fresh score calculation for those only
+            if not d.results:
+                score_card = {**d.as_score_card(), "history": score_card["history"]}
+
+            formatted = _format_score_card(score_card)
             result.append(DashboardResponse(**formatted))
-        return result
+        return _dashboards_json_response(result)
     
-    # Otherwise, return basic summary
-    return [
-        DashboardResponse(
+    # Otherwise, return basic summary, reading only the columns it needs
+    # Values come straight from the database, skip validating each one
+    return _dashboards_json_response([
+        DashboardResponse.construct(
             id=str(d.id),
             project_code=d.project_code,
             name=d.name,
@@ -184,8 +313,12 @@ def list_dashboards(
             categories=[],
             history=[]
         )
-        for d in definitions
-    ]
+        for d in ScoreDefinition.list_summary(
+            project_code=project_code,
+            name_filter=name_filter,
+            sorted_by=sorted_by,
+        )
+    ])
 
 
 
@@ -194,6 +327,8 @@ def get_dashboard(
     dashboard_id: str,
     include_breakdown: bool = Query(False, description="Include breakdown data"),
     include_history: bool = Query(True, description="Include historical data"),
+    score_type: Literal["score", "cde_score"] = Query("score", description="Score type to breakdown"),
+    group_by: GroupByCategory = Query(GroupByCategory.column_name, description="Category to group the breakdown by"),
     db: Session = Depends(get_db_session)
 ):
     """
@@ -203,26 +338,27 @@ def get_dashboard(
         dashboard_id: Dashboard UUID
         include_breakdown: Whether to include breakdown data
         include_history: Whether to include historical data
+        score_type: Type of score to breakdown, if include_breakdown is set
+        group_by: Category to group the breakdown by, if include_breakdown is set
         db: Database session
         
     Returns:
         Full dashboard details with scores
+        
+    Examples:
+        # Get dashboard and its breakdown by table in a single request
+        GET /api/data-quality/dashboards/{dashboard_id}?include_breakdown=true&score_type=score&group_by=table_name
     """
-    dashboard = validate_dashboard_id(dashboard_id, db)
-    
-    # Get cached score card with optional history
-    if include_history:
-        # Reload with history
-        definitions = ScoreDefinition.all(
-            project_code=dashboard.project_code,
-            last_history_items=50
-        )
-        dashboard = next((d for d in definitions if str(d.id) == dashboard_id), dashboard)
+    # Get the dashboard along with its latest history entries, if requested
+    dashboard = validate_dashboard_id(dashboard_id, db, last_history_items=50 if include_history else 0)
     
     score_card = dashboard.as_cached_score_card(include_definition=True)
-    formatted = format_score_card(score_card)
+    formatted = _format_score_card(score_card)
     
-    return DashboardResponse(**formatted)
+    if include_breakdown:
+        formatted["breakdown"] = _get_breakdown_items(dashboard, score_type, _normalize_group_by(group_by))
+    
+    return _dashboards_json_response(DashboardResponse(**formatted))
 
 
 @router.get("/dashboards/{dashboard_id}/breakdown", response_model=List[BreakdownItem])
@@ -245,49 +381,9 @@ def get_dashboard_breakdown(
         List of breakdown items
     """
     dashboard = validate_dashboard_id(dashboard_id, db)
+    normalized_group_by = _normalize_group_by(group_by)
     
-    # Convert enum to string value
-    group_by_value = group_by.value
-    
-    # Normalize and validate group_by parameter
-    # Map common variations to correct column names (for backwards compatibility)
-    group_by_mapping = {
-        "table_group": "table_groups_name",
-        "table group": "table_groups_name",
-        "tablegroup": "table_groups_name",
-    }
-    
-    # Normalize the group_by value
-    normalized_group_by = group_by_mapping.get(group_by_value.lower().replace("_", " ").strip(), group_by_value)
-    
-    # Valid categories from TestGen (already validated by enum, but kept for safety)
-    valid_categories = [
-        "column_name",
-        "table_name",
-        "dq_dimension",
-        "semantic_data_type",
-        "table_groups_name",
-        "data_location",
-        "data_source",
-        "source_system",
-        "source_process",
-        "business_domain",
-        "stakeholder_group",
-        "transform_level",
-        "data_product",
-    ]
-    
-    if normalized_group_by not in valid_categories:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid group_by parameter: '{group_by}'. Must be one of: {', '.join(valid_categories)}"
-        )
-    
-    # Get breakdown data
-    breakdown_data = dashboard.get_score_card_breakdown(score_type, normalized_group_by)
-    formatted = format_score_card_breakdown(breakdown_data, normalized_group_by)
-    
-    return [BreakdownItem(**item) for item in formatted["items"]]
+    return _get_breakdown_items(dashboard, score_type, normalized_group_by)
 
 
 @router.get("/dashboards/{dashboard_id}/issues", response_model=List[IssueItem])
@@ -312,47 +408,13 @@ def get_dashboard_issues(
         List of issues
     """
     dashboard = validate_dashboard_id(dashboard_id, db)
-    
-    # Convert enum to string value
-    group_by_value = group_by.value
-    
-    # Normalize and validate group_by parameter (same as breakdown endpoint)
-    group_by_mapping = {
-        "table_group": "table_groups_name",
-        "table group": "table_groups_name",
-        "tablegroup": "table_groups_name",
-    }
-    
-    normalized_group_by = group_by_mapping.get(group_by_value.lower().replace("_", " ").strip(), group_by_value)
-    
-    # Valid categories from TestGen (already validated by enum, but kept for safety)
-    valid_categories = [
-        "column_name",
-        "table_name",
-        "dq_dimension",
-        "semantic_data_type",
-        "table_groups_name",
-        "data_location",
-        "data_source",
-        "source_system",
-        "source_process",
-        "business_domain",
-        "stakeholder_group",
-        "transform_level",
-        "data_product",
-    ]
-    
-    if normalized_group_by not in valid_categories:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid group_by parameter: '{group_by}'. Must be one of: {', '.join(valid_categories)}"
-        )
+    normalized_group_by = _normalize_group_by(group_by)
     
     # Get issues data
     issues_data = dashboard.get_score_card_issues(score_type, normalized_group_by, value)
     formatted = format_score_card_issues(issues_data, normalized_group_by)
     
-    return [IssueItem(**item) for item in formatted["items"]]
+    return _parse_issue_items(formatted["items"])
 
 
 @router.put("/dashboards/{dashboard_id}", response_model=DashboardResponse)
@@ -382,18 +444,11 @@ def update_dashboard(
     if updates.cde_score is not None:
         dashboard.cde_score = updates.cde_score
     if updates.category is not None:
-        dashboard.category = ScoreCategory[updates.category]
+        dashboard.category = _get_score_category(updates.category)
     
     # Update filters if provided
     if updates.filters is not None:
-        filters_data = [
-            {
-                "field": f.field,
-                "value": f.value,
-                "others": f.others
-            }
-            for f in updates.filters
-        ]
+        filters_data = [f.dict() for f in updates.filters]
         dashboard.criteria = ScoreDefinitionCriteria.from_filters(
             filters_data,
             group_by_field=updates.group_by_field if updates.group_by_field is not None else True
@@ -404,7 +459,7 @@ def update_dashboard(
     
     # Return updated dashboard
     score_card = dashboard.as_cached_score_card(include_definition=True)
-    formatted = format_score_card(score_card)
+    formatted = _format_score_card(score_card)
     
     return DashboardResponse(**formatted)
 
@@ -425,42 +480,98 @@ def delete_dashboard(
     dashboard.delete()
 
 
-@router.post("/dashboards/{dashboard_id}/recalculate", response_model=RecalculateResponse)
+@router.post(
+    "/dashboards/{dashboard_id}/recalculate",
+    response_model=RecalculateResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
 def recalculate_dashboard(
     dashboard_id: str,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db_session)
 ):
     """
-    Recalculate scores for a dashboard.
+    Queue the recalculation of the scores for a dashboard.
+    
+    The refresh runs in the background after the response is sent; fetch the
+    dashboard again to get the fresh scores and the new history entry.
     
     Args:
         dashboard_id: Dashboard UUID
+        background_tasks: FastAPI background tasks
         db: Database session
         
     Returns:
-        Updated dashboard with fresh scores
+        Dashboard with its current cached scores
     """
     dashboard = validate_dashboard_id(dashboard_id, db)
     
     # Refresh the scores and save them to the database
     # This populates score_definition_results table so the UI can display the dashboard
     # add_history_entry=True adds a history entry for the score graphs
-    run_refresh_score_cards_results(definition_id=dashboard_id, add_history_entry=True)
+    # The refresh is wrapped in with_database_session, so it opens its own database
+    # session whenever the request's one is no longer current when the task runs
+    background_tasks.add_task(run_refresh_score_cards_results, definition_id=dashboard_id, add_history_entry=True)
     
-    # Get the cached score card (now populated with results and history)
+    # Get the currently cached score card
     score_card = dashboard.as_cached_score_card(include_definition=True)
-    formatted = format_score_card(score_card)
+    formatted = _format_score_card(score_card)
     
     return RecalculateResponse(
-        message="Dashboard scores recalculated successfully",
+        message="Dashboard scores recalculation queued",
         dashboard=DashboardResponse(**formatted)
     )
 
+# ============================================================================
+# Filter Options Cache
+# ============================================================================
+
+# Filter values and columns only change when profiling/test runs or metadata
+# edits happen, so serving them slightly stale is fine
+FILTER_OPTIONS_CACHE_TTL = 60  # seconds
+FILTER_OPTIONS_CACHE_MAXSIZE = 128
+
+_filter_options_cache: dict = {}
+_filter_options_cache_lock = threading.Lock()
+
+
+def cache_per_project(func):
+    """
+    Caches the result of a `(project_code, db)` helper per project code
+    for FILTER_OPTIONS_CACHE_TTL seconds.
+    """
+    @functools.wraps(func)
+    def wrapper(project_code: str, db: Session):
+        key = (func.__name__, project_code)
+        now = time.monotonic()
+
+        with _filter_options_cache_lock:
+            cached = _filter_options_cache.get(key)
+        if cached and cached[0] > now:
+            return cached[1]
+
+        value = func(project_code, db)
+
+        with _filter_options_cache_lock:
+            if len(_filter_options_cache) >= FILTER_OPTIONS_CACHE_MAXSIZE:
+                # Drop expired entries first, then the oldest ones if still full
+                for expired_key in [k for k, (expires_at, _) in _filter_options_cache.items() if expires_at <= now]:
+                    del _filter_options_cache[expired_key]
+                while len(_filter_options_cache) >= FILTER_OPTIONS_CACHE_MAXSIZE:
+                    del _filter_options_cache[next(iter(_filter_options_cache))]
+            _filter_options_cache[key] = (now + FILTER_OPTIONS_CACHE_TTL, value)
+
+        return value
+
+    return wrapper
+
+
 # ============================================================================
 # Filter Options Helper Functions
 # ============================================================================
 
-def get_filter_field_values(project_code: str, db: Session) -> Dict[str, List[str]]:
+@cache_per_project
+def get_filter_field_values(project_code: str, db: Session) -> List[FilterGroup]:
     """
     Get all available values for each filter field.
     Based on TestGen's get_score_category_values function.
@@ -468,8 +579,6 @@ def get_filter_field_values(project_code: str, db: Session) -> Dict[str, List[st
     Note: dq_dimension is NOT included in the database query because it's only
     used for categories/grouping, not for filtering. It has static values.
     """
-    values = defaultdict(list)
-    
     # DQ dimensions are static and used for categories/grouping, NOT for filtering
     # They are NOT included in filter_values
     
@@ -486,34 +595,36 @@ def get_filter_field_values(project_code: str, db: Session) -> Dict[str, List[st
         "data_product",
     ]
     
-    quote = lambda v: f"'{v}'"
+    # Unpivot every category column of both views into (category, value) rows in a
+    # single pass, then aggregate the sorted distinct values of each category
+    columns = ", ".join(categories)
+    category_values = ", ".join(f"('{c}', scoring.{c}::text)" for c in categories)
     query = f"""
-        SELECT *
+        SELECT category, ARRAY_AGG(value ORDER BY LOWER(value)) AS category_values
         FROM (
-            SELECT DISTINCT
-                UNNEST(array[{', '.join([quote(c) for c in categories])}]) as category,
-                UNNEST(array[{', '.join(categories)}]) AS value
-            FROM v_dq_test_scoring_latest_by_column
-            WHERE project_code = :project_code
-            UNION
-            SELECT DISTINCT
-                UNNEST(array[{', '.join([quote(c) for c in categories])}]) as category,
-                UNNEST(array[{', '.join(categories)}]) AS value
-            FROM v_dq_profile_scoring_latest_by_column
-            WHERE project_code = :project_code
-        ) category_values
-        WHERE value IS NOT NULL
-        ORDER BY LOWER(value)
+            SELECT DISTINCT category_value.category, category_value.value
+            FROM (
+                SELECT {columns}
+                FROM v_dq_test_scoring_latest_by_column
+                WHERE project_code = :project_code
+                UNION ALL
+                SELECT {columns}
+                FROM v_dq_profile_scoring_latest_by_column
+                WHERE project_code = :project_code
+            ) scoring,
+            LATERAL (VALUES {category_values}) AS category_value(category, value)
+            WHERE category_value.value IS NOT NULL
+                AND category_value.value <> ''
+        ) distinct_values
+        GROUP BY category
+        ORDER BY category
     """
     
     results = fetch_all_from_db(query, {"project_code": project_code})
-    for row in results:
-        if row.category and row.value:
-            values[row.category].append(row.value)
-    
-    return dict(values)
+    return [FilterGroup.construct(field=row.category, values=list(row.category_values)) for row in results]
 
 
+@cache_per_project
 def get_column_hierarchy(project_code: str, db: Session) -> List[ColumnHierarchy]:
     """
     Get hierarchical column data (table groups → tables → columns).
@@ -533,14 +644,70 @@ def get_column_hierarchy(project_code: str, db: Session) -> List[ColumnHierarchy
     ORDER BY LOWER(table_groups_name), LOWER(table_name), ordinal_position;
     """
     
-    results = fetch_all_from_db(query, {"project_code": project_code})
-    return [ColumnHierarchy(**dict(row)) for row in results]
+    # Rows come straight from the database schema, skip validating each one
+    return [ColumnHierarchy.construct(**row) for row in stream_from_db(query, {"project_code": project_code})]
 
 
 # ============================================================================
 # Filter Options Endpoint
 # ============================================================================
 
+# Static options, built once and shared by every request
+
+# Filter field metadata (labels for UI display)
+_FILTER_FIELDS_METADATA = (
+    FilterFieldMeta(field="table_groups_name", label="Table Group"),
+    FilterFieldMeta(field="data_location", label="Data Location"),
+    FilterFieldMeta(field="data_source", label="Data Source"),
+    FilterFieldMeta(field="source_system", label="Source System"),
+    FilterFieldMeta(field="source_process", label="Source Process"),
+    FilterFieldMeta(field="business_domain", label="Business Domain"),
+    FilterFieldMeta(field="stakeholder_group", label="Stakeholder Group"),
+    FilterFieldMeta(field="transform_level", label="Transform Level"),
+    FilterFieldMeta(field="data_product", label="Data Product"),
+)
+
+# Category options (for "Display on scorecard")
+_CATEGORY_OPTIONS = (
+    CategoryOption(value="table_groups_name", label="Table Group"),
+    CategoryOption(value="data_location", label="Data Location"),
+    CategoryOption(value="data_source", label="Data Source"),
+    CategoryOption(value="source_system", label="Source System"),
+    CategoryOption(value="source_process", label="Source Process"),
+    CategoryOption(value="business_domain", label="Business Domain"),
+    CategoryOption(value="stakeholder_group", label="Stakeholder Group"),
+    CategoryOption(value="transform_level", label="Transform Level"),
+    CategoryOption(value="dq_dimension", label="Quality Dimension"),
+    CategoryOption(value="data_product", label="Data Product"),
+)
+
+# Score grouping options (for breakdown)
+_SCORE_GROUPING_OPTIONS = (
+    {"value": "column_name", "label": "Column"},
+    {"value": "table_name", "label": "Table"},
+    {"value": "dq_dimension", "label": "Quality Dimension"},
+    {"value": "semantic_data_type", "label": "Semantic Data Type"},
+    {"value": "table_groups_name", "label": "Table Group"},
+    {"value": "data_location", "label": "Data Location"},
+    {"value": "data_source", "label": "Data Source"},
+    {"value": "source_system", "label": "Source System"},
+    {"value": "source_process", "label": "Source Process"},
+    {"value": "business_domain", "label": "Business Domain"},
+    {"value": "stakeholder_group", "label": "Stakeholder Group"},
+    {"value": "transform_level", "label": "Transform Level"},
+    {"value": "data_product", "label": "Data Product"},
+)
+
+# Score type options
+_SCORE_TYPE_OPTIONS = (
+    {"value": "score", "label": "Total Score"},
+    {"value": "cde_score", "label": "CDE Score"},
+)
+
+# Workers to fetch filter values while the request thread fetches the columns
+_filter_options_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="filter-options")
+
+
 @router.get("/filter-options", response_model=FilterOptions)
 def get_dashboard_filter_options(
     project_code: str = Query(..., description="Project code to get filter options for"),
@@ -580,76 +747,30 @@ def get_dashboard_filter_options(
     # Validate project exists
     validate_project_code(project_code, db)
     
-    # Initialize response with empty/default values
-    filter_fields_metadata = []
-    filter_values = {}
+    # Filter field metadata (labels for UI display)
+    filter_fields_metadata = _FILTER_FIELDS_METADATA if include_filter_values else ()
+    category_options = _CATEGORY_OPTIONS if include_category_options else ()
+    score_grouping_options = _SCORE_GROUPING_OPTIONS if include_score_grouping_options else ()
+    score_type_options = _SCORE_TYPE_OPTIONS if include_score_type_options else ()
+    filter_values = []
     columns = []
-    category_options = []
-    score_grouping_options = []
-    score_type_options = []
     
-    # Filter field metadata (labels for UI display)
-    if include_filter_values:
-        filter_fields_metadata = [
-            {"field": "table_groups_name", "label": "Table Group"},
-            {"field": "data_location", "label": "Data Location"},
-            {"field": "data_source", "label": "Data Source"},
-            {"field": "source_system", "label": "Source System"},
-            {"field": "source_process", "label": "Source Process"},
-            {"field": "business_domain", "label": "Business Domain"},
-            {"field": "stakeholder_group", "label": "Stakeholder Group"},
-            {"field": "transform_level", "label": "Transform Level"},
-            {"field": "data_product", "label": "Data Product"},
-        ]
+    if include_filter_values and include_columns:
+        # Run both lookups concurrently, the worker thread uses its own pooled session
+        filter_values_future = _filter_options_executor.submit(
+            with_database_session(get_filter_field_values), project_code, db
+        )
+        columns = get_column_hierarchy(project_code, db)
+        filter_values = filter_values_future.result()
     
     # Get filter field values (only if requested)
-    if include_filter_values:
+    elif include_filter_values:
         filter_values = get_filter_field_values(project_code, db)
     
     # Get column hierarchy (only if requested)
-    if include_columns:
+    elif include_columns:
         columns = get_column_hierarchy(project_code, db)
     
-    # Category options (for "Display on scorecard")
-    if include_category_options:
-        category_options = [
-            {"value": "table_groups_name", "label": "Table Group"},
-            {"value": "data_location", "label": "Data Location"},
-            {"value": "data_source", "label": "Data Source"},
-            {"value": "source_system", "label": "Source System"},
-            {"value": "source_process", "label": "Source Process"},
-            {"value": "business_domain", "label": "Business Domain"},
-            {"value": "stakeholder_group", "label": "Stakeholder Group"},
-            {"value": "transform_level", "label": "Transform Level"},
-            {"value": "dq_dimension", "label": "Quality Dimension"},
-            {"value": "data_product", "label": "Data Product"},
-        ]
-    
-    # Score grouping options (for breakdown)
-    if include_score_grouping_options:
-        score_grouping_options = [
-            {"value": "column_name", "label": "Column"},
-            {"value": "table_name", "label": "Table"},
-            {"value": "dq_dimension", "label": "Quality Dimension"},
-            {"value": "semantic_data_type", "label": "Semantic Data Type"},
-            {"value": "table_groups_name", "label": "Table Group"},
-            {"value": "data_location", "label": "Data Location"},
-            {"value": "data_source", "label": "Data Source"},
-            {"value": "source_system", "label": "Source System"},
-            {"value": "source_process", "label": "Source Process"},
-            {"value": "business_domain", "label": "Business Domain"},
-            {"value": "stakeholder_group", "label": "Stakeholder Group"},
-            {"value": "transform_level", "label": "Transform Level"},
-            {"value": "data_product", "label": "Data Product"},
-        ]
-    
-    # Score type options
-    if include_score_type_options:
-        score_type_options = [
-            {"value": "score", "label": "Total Score"},
-            {"value": "cde_score", "label": "CDE Score"},
-        ]
-    
     return FilterOptions(
         filter_fields_metadata=filter_fields_metadata,
         filter_values=filter_values,
@@ -1,56 +1,61 @@
-from datetime import datetime
+from enum import IntEnum
+from functools import lru_cache
 from typing import Literal, Optional
-from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, constr, validator
+
+# Categories a dashboard can group its scores by
+CategoryT = Literal[
+    "table_groups_name",
+    "data_location",
+    "data_source",
+    "source_system",
+    "source_process",
+    "business_domain",
+    "stakeholder_group",
+    "transform_level",
+    "dq_dimension",
+    "data_product",
+]
+
+# Dashboard name, shared by the create and update schemas
+NameStr = constr(min_length=1, max_length=255)
+
+
+class FilterPair(BaseModel):
+    """Field and value of a linked filter"""
+    field: str = Field(..., description="Field name to filter on")
+    value: str = Field(..., description="Value to filter by")
+
+    class Config:
+        extra = "ignore"
+        frozen = True
 
 
 class DashboardFilterCreate(BaseModel):
     """Filter definition for dashboard creation"""
     field: str = Field(..., description="Field name to filter on")
     value: str = Field(..., description="Value to filter by")
-    others: list[dict[str, str]] = Field(default_factory=list, description="Linked filters")
+    others: list[FilterPair] = Field(default_factory=list, description="Linked filters")
 
 
 class DashboardCreate(BaseModel):
     """Request schema for creating a new dashboard"""
-    name: str = Field(..., min_length=1, max_length=255, description="Dashboard name")
+    name: NameStr = Field(..., description="Dashboard name")
     project_code: str = Field(..., description="Project code this dashboard belongs to")
     total_score: bool = Field(default=True, description="Calculate total score")
     cde_score: bool = Field(default=False, description="Calculate CDE score")
-    category: Optional[Literal[
-        "table_groups_name",
-        "data_location",
-        "data_source",
-        "source_system",
-        "source_process",
-        "business_domain",
-        "stakeholder_group",
-        "transform_level",
-        "dq_dimension",
-        "data_product"
-    ]] = Field(None, description="Category to group scores by")
+    category: Optional[CategoryT] = Field(None, description="Category to group scores by")
     filters: list[DashboardFilterCreate] = Field(default_factory=list, description="Filter criteria")
     group_by_field: bool = Field(default=True, description="Group filters by field name")
 
 
 class DashboardUpdate(BaseModel):
     """Request schema for updating a dashboard"""
-    name: Optional[str] = Field(None, min_length=1, max_length=255, description="Dashboard name")
+    name: Optional[NameStr] = Field(None, description="Dashboard name")
     total_score: Optional[bool] = Field(None, description="Calculate total score")
     cde_score: Optional[bool] = Field(None, description="Calculate CDE score")
-    category: Optional[Literal[
-        "table_groups_name",
-        "data_location",
-        "data_source",
-        "source_system",
-        "source_process",
-        "business_domain",
-        "stakeholder_group",
-        "transform_level",
-        "dq_dimension",
-        "data_product"
-    ]] = Field(None, description="Category to group scores by")
+    category: Optional[CategoryT] = Field(None, description="Category to group scores by")
     filters: Optional[list[DashboardFilterCreate]] = Field(None, description="Filter criteria")
     group_by_field: Optional[bool] = Field(None, description="Group filters by field name")
 
@@ -60,12 +65,50 @@ class CategoryScore(BaseModel):
     label: str = Field(..., description="Category label")
     score: Optional[str] = Field(None, description="Formatted score value")
 
+    class Config:
+        frozen = True
+        # Instances are immutable, share them instead of copying on validation
+        copy_on_model_validation = "none"
+
+
+@lru_cache(maxsize=1024)
+def make_category_score(label: str, score: Optional[str]) -> CategoryScore:
+    """Get a shared CategoryScore, labels and scores repeat across dashboards."""
+    return CategoryScore(label=label, score=score)
+
+
+class ScoreKind(IntEnum):
+    """Score type of a history entry, sent as its integer value"""
+    score = 0
+    cde_score = 1
+
 
 class HistoryEntry(BaseModel):
     """Historical score entry"""
     score: float = Field(..., description="Score value (0-100)")
-    category: Literal["score", "cde_score"] = Field(..., description="Score type")
-    time: str = Field(..., description="Timestamp in ISO format")
+    category: ScoreKind = Field(..., description="Score type: 0 = score, 1 = cde_score")
+    time: int = Field(..., description="Timestamp in epoch seconds")
+
+    class Config:
+        frozen = True
+
+    @validator("category", pre=True)
+    def _parse_category_name(cls, value):
+        # Score history rows carry the score type by name
+        return ScoreKind.__members__.get(value, value) if isinstance(value, str) else value
+
+
+class BreakdownItem(BaseModel):
+    """Score breakdown item"""
+    impact: str = Field(..., description="Impact percentage")
+    score: str = Field(..., description="Score value")
+    issue_ct: int = Field(..., description="Number of issues")
+    # Category specific fields, only the ones of the requested grouping
+    # e.g. {"table_groups_id": "...", "table_name": "..."} when grouped by table_name
+    details: dict[str, Optional[str]] = Field(default_factory=dict, description="Values identifying the breakdown item")
+
+    class Config:
+        extra = "ignore"
 
 
 class DashboardResponse(BaseModel):
@@ -73,13 +116,14 @@ class DashboardResponse(BaseModel):
     id: str = Field(..., description="Dashboard UUID")
     project_code: str = Field(..., description="Project code")
     name: str = Field(..., description="Dashboard name")
-    score: Optional[str] = Field(None, description="Overall score")
-    cde_score: Optional[str] = Field(None, description="CDE score")
-    profiling_score: Optional[str] = Field(None, description="Profiling score")
-    testing_score: Optional[str] = Field(None, description="Testing score")
+    score: Optional[float] = Field(None, description="Overall score (0-100)")
+    cde_score: Optional[float] = Field(None, description="CDE score (0-100)")
+    profiling_score: Optional[float] = Field(None, description="Profiling score (0-100)")
+    testing_score: Optional[float] = Field(None, description="Testing score (0-100)")
     categories_label: Optional[str] = Field(None, description="Label for category grouping")
     categories: list[CategoryScore] = Field(default_factory=list, description="Category scores")
     history: list[HistoryEntry] = Field(default_factory=list, description="Historical scores")
+    breakdown: Optional[list[BreakdownItem]] = Field(None, description="Score breakdown, if requested")
 
 
 class DashboardSummary(BaseModel):
@@ -91,30 +135,8 @@ class DashboardSummary(BaseModel):
     cde_score: bool = Field(..., description="Has CDE score")
     category: Optional[str] = Field(None, description="Category grouping")
 
-
-class BreakdownItem(BaseModel):
-    """Score breakdown item"""
-    impact: str = Field(..., description="Impact percentage")
-    score: str = Field(..., description="Score value")
-    issue_ct: int = Field(..., description="Number of issues")
-    # Dynamic fields based on category
-    table_groups_id: Optional[str] = None
-    table_name: Optional[str] = None
-    column_name: Optional[str] = None
-    dq_dimension: Optional[str] = None
-    semantic_data_type: Optional[str] = None
-    table_groups_name: Optional[str] = None
-    data_location: Optional[str] = None
-    data_source: Optional[str] = None
-    source_system: Optional[str] = None
-    source_process: Optional[str] = None
-    business_domain: Optional[str] = None
-    stakeholder_group: Optional[str] = None
-    transform_level: Optional[str] = None
-    data_product: Optional[str] = None
-
     class Config:
-        extra = "allow"
+        frozen = True
 
 
 class IssueItem(BaseModel):
@@ -124,12 +146,18 @@ class IssueItem(BaseModel):
     detail: str = Field(..., description="Issue details")
     time: int = Field(..., description="Timestamp")
     column: Optional[str] = Field(None, description="Column name if applicable")
+    id: Optional[str] = Field(None, description="Issue UUID")
+    issue_type: Optional[Literal["hygiene", "test"]] = Field(None, description="Issue source")
+    table_group_id: Optional[str] = Field(None, description="Table group UUID")
+    table: Optional[str] = Field(None, description="Table name")
+    name: Optional[str] = Field(None, description="Test suite name, empty for hygiene issues")
+    run_id: Optional[str] = Field(None, description="Profiling or test run UUID")
 
     class Config:
-        extra = "allow"
+        extra = "ignore"
 
 
 class RecalculateResponse(BaseModel):
     """Response for recalculate operation"""
     message: str = Field(..., description="Success message")
-    dashboard: DashboardResponse = Field(..., description="Updated dashboard")
+    dashboard: DashboardResponse = Field(..., description="Dashboard with its current cached scores")
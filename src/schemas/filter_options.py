@@ -1,6 +1,7 @@
-from typing import Dict, List
 from pydantic import BaseModel, Field
 
+from src.schemas.data_quality import CategoryT
+
 
 class ColumnHierarchy(BaseModel):
     """Column hierarchy for filter selection"""
@@ -11,12 +12,52 @@ class ColumnHierarchy(BaseModel):
     table_group_id: str = Field(..., description="Table group UUID")
     table_group_name: str = Field(..., description="Table group name")
 
+    class Config:
+        frozen = True
+        # Columns are cached per project, reuse them instead of copying on validation
+        copy_on_model_validation = "none"
+
+
+class FilterFieldMeta(BaseModel):
+    """Filter field with its label for UI display"""
+    field: CategoryT = Field(..., description="Filter field name")
+    label: str = Field(..., description="Filter field label")
+
+    class Config:
+        extra = "ignore"
+        frozen = True
+        # Options are prebuilt module constants, reuse them instead of copying on validation
+        copy_on_model_validation = "none"
+
+
+class CategoryOption(BaseModel):
+    """Category available for scorecard display"""
+    value: CategoryT = Field(..., description="Category name")
+    label: str = Field(..., description="Category label")
+
+    class Config:
+        extra = "ignore"
+        frozen = True
+        # Options are prebuilt module constants, reuse them instead of copying on validation
+        copy_on_model_validation = "none"
+
+
+class FilterGroup(BaseModel):
+    """Available values of one filter field"""
+    field: CategoryT = Field(..., description="Filter field name")
+    values: list[str] = Field(..., description="Available values, sorted case-insensitively")
+
+    class Config:
+        frozen = True
+        # Groups are cached per project, reuse them instead of copying on validation
+        copy_on_model_validation = "none"
+
 
 class FilterOptions(BaseModel):
     """All available filter options for dashboard creation"""
     
     # Filter field metadata (labels for UI display)
-    filter_fields_metadata: List[Dict[str, str]] = Field(
+    filter_fields_metadata: list[FilterFieldMeta] = Field(
         ...,
         description="Metadata for filter fields including labels",
         example=[
@@ -26,23 +67,23 @@ class FilterOptions(BaseModel):
     )
     
     # Filter field values (for "Filter by" dropdowns)
-    filter_values: Dict[str, List[str]] = Field(
+    filter_values: list[FilterGroup] = Field(
         ...,
         description="Available values for each filter field",
-        example={
-            "table_groups_name": ["demo", "production"],
-            "data_source": ["postgres", "snowflake"],
-        }
+        example=[
+            {"field": "data_source", "values": ["postgres", "snowflake"]},
+            {"field": "table_groups_name", "values": ["demo", "production"]},
+        ]
     )
     
     # Column hierarchy (for "Selected Columns" filter)
-    columns: List[ColumnHierarchy] = Field(
+    columns: list[ColumnHierarchy] = Field(
         ...,
         description="Hierarchical list of table groups → tables → columns"
     )
     
     # Category options (for "Display on scorecard" dropdown)
-    category_options: List[Dict[str, str]] = Field(
+    category_options: list[CategoryOption] = Field(
         ...,
         description="Available categories for scorecard display",
         example=[
@@ -52,7 +93,7 @@ class FilterOptions(BaseModel):
     )
     
     # Score grouping options (for "Score grouped by" dropdown)
-    score_grouping_options: List[Dict[str, str]] = Field(
+    score_grouping_options: list[dict[str, str]] = Field(
         ...,
         description="Available options for score grouping",
         example=[
@@ -63,7 +104,7 @@ class FilterOptions(BaseModel):
     )
     
     # Score type options (for "Total Score" / "CDE Score" selection)
-    score_type_options: List[Dict[str, str]] = Field(
+    score_type_options: list[dict[str, str]] = Field(
         ...,
         description="Available score types",
         example=[